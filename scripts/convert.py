@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Конвертация выгрузки показов из xlsx в Parquet.
+
+Бот читает data/showings.parquet вместо data/showings.xlsx, если Parquet-файл
+не старше xlsx — это в разы быстрее, чем разбирать Excel. Запускать после
+каждого обновления выгрузки.
+"""
+import argparse
+from pathlib import Path
+
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DATA_FILE = PROJECT_ROOT / "data" / "showings.xlsx"
+
+
+def convert(src: Path, dst: Path) -> int:
+    """Сохранить xlsx в Parquet. Возвращает количество строк."""
+    df = pd.read_excel(src)
+    
+    # Parquet не хранит колонки со смешанными типами (например, число в «Объект»)
+    for col in df.columns[df.dtypes == object]:
+        df[col] = df[col].astype("string")
+    
+    df.to_parquet(dst, index=False)
+    return len(df)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Сконвертировать выгрузку показов из xlsx в Parquet"
+    )
+    parser.add_argument(
+        "--file", "-f",
+        type=Path,
+        default=DATA_FILE,
+        help="Путь к xlsx файлу (по умолчанию: data/showings.xlsx)"
+    )
+    parser.add_argument(
+        "--out", "-o",
+        type=Path,
+        help="Куда сохранить Parquet (по умолчанию: рядом с xlsx, расширение .parquet)"
+    )
+    
+    args = parser.parse_args()
+    out = args.out or args.file.with_suffix(".parquet")
+    
+    try:
+        rows = convert(args.file, out)
+        print(f"✅ {args.file} → {out} ({rows} строк)")
+    except Exception as e:
+        print(f"Ошибка: {e}")
+        return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -4,7 +4,7 @@ V1 Match CLI — поиск брокеров по объекту
 """
 import argparse
 import json
-from matcher import find_brokers
+from matcher import Matcher
 
 
 def main():
@@ -46,8 +46,7 @@ def main():
     args = parser.parse_args()
     
     try:
-        result = find_brokers(
-            file_path=args.file,
+        result = Matcher(args.file).find_brokers(
             object_query=args.object,
             days=args.days,
             match_mode=args.match,
@@ -1,23 +1,638 @@
 """
-V1 Match: поиск брокеров по объекту
+V1 Match: поиск брокеров по объекту и району.
+Общее ядро для CLI (main.py) и Telegram-бота (bot.py).
 """
-import pandas as pd
+import json
+import re
+import threading
+from collections import defaultdict, namedtuple
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import chain
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from rapidfuzz import fuzz, process
+
+# Группы синонимов: объекты, которые являются одним ЖК
+# При поиске одного — показываем брокеров по всем из группы
+SYNONYMS = [
+    # Кириллица ↔ Латиница
+    ["Прайм парк", "Prime Park"],
+    ["Шагал", "Shagal"],
+    ["Соул", "Soul"],
+    ["Слава", "Slava"],
+    ["Ракурс", "Rakurs"],
+    ["Принципал плаза", "Principal Plaza"],
+    ["Примавера новая", "Primavera"],
+    ["Синатра", "Sinatra вторичка"],
+    ["Балчуг резиденс", "Balchug Residence"],
+    ["Сидней Сити", "Sidney City", "Sydney city"],
+    
+    # Вторичка = Первичка
+    ["Башня Федерация", "Башня Федерация вторичка"],
+    ["Садовые кварталы", "Вторичка Садовые кварталы"],
+    ["Династия", "Вторичка Династия"],
+    ["Knightsbridge Private Park", "Вторичка Knightsbridge Private Park"],
+    ["Остров", "Остров Вторичка"],
+    ["ЖК Крылья", "Крылья вторичка"],
+    
+    # Разные написания
+    ["ЖК Таврический", "Таврический"],
+    ["Дом в Николино", "Николино"],
+    ["Башня Город Столиц", "Город Столиц"],
+    ["Level Мичуринский", "Мичуринский"],
+    ["Canal Front", "Canal Front Residences 3"],
+    ["Поклонная 9", "Поклонная, 9", "Покланная 9"],  # + опечатка
+    
+    # Опечатки
+    ["Lucky", "Lacky"],
+]
+
+# Словарь алиасов: запрос → на что заменить
+# Фонетические соответствия, опечатки, альтернативные написания
+ALIASES = {
+    # Фонетика: кириллица → латиница
+    "клауд": "cloud",
+    "клауд тауэр": "cloud tower",
+    "тауэр": "tower",
+    "гранд": "grand",
+    "гарден": "garden",
+    "вест гарден": "west garden",
+    "вест": "west",
+    "резиденс": "residences",
+    "пиннакл": "pinnacle",
+    "марина": "marina",
+    "канал": "canal",
+    "фронт": "front",
+    "панорамик": "panoramic",
+    "стелла": "stella",
+    "марис": "maris",
+    "вида": "vida",
+    "крик": "creek",
+    "бич": "beach",
+    
+    # Опечатки в данных
+    "поклонная": "покланная",  # в данных с опечаткой
+    
+    # Альтернативные написания
+    "праймпарк": "прайм парк",
+    "прайм": "прайм парк",
+    "артхаус": "артхаус",
+    "веллтон": "веллтон тауэрс",
+    "квартал на ленинском": "жк квартал на ленинском",
+}
+
+# Показы за период + заранее подготовленные списки и индексы объектов для поиска
+ShowingsData = namedtuple(
+    "ShowingsData",
+    ["df", "objects", "objects_translit", "norm_to_obj", "translit_to_obj", "token_index"]
+)
+
+# Справочник районов: entries — (объект для ответа, район и город в нормализованном виде),
+# by_name — нормализованный район или город → готовый результат get_objects_by_district
+DistrictsData = namedtuple(
+    "DistrictsData",
+    ["objects", "entries", "by_name", "all_districts", "all_districts_norm"]
+)
+
+
+# Таблица транслитерации кириллицы в латиницу (для str.translate)
+_TRANSLIT = str.maketrans({
+    'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'д': 'd', 'е': 'e', 'ё': 'e',
+    'ж': 'zh', 'з': 'z', 'и': 'i', 'й': 'y', 'к': 'k', 'л': 'l', 'м': 'm',
+    'н': 'n', 'о': 'o', 'п': 'p', 'р': 'r', 'с': 's', 'т': 't', 'у': 'u',
+    'ф': 'f', 'х': 'h', 'ц': 'ts', 'ч': 'ch', 'ш': 'sh', 'щ': 'sch',
+    'ъ': '', 'ы': 'y', 'ь': '', 'э': 'e', 'ю': 'yu', 'я': 'ya'
+})
+
+
+def transliterate_ru_to_en(text: str) -> str:
+    """Транслитерация кириллицы в латиницу"""
+    text = text.lower()
+    # Латинские названия переводить не нужно — isascii() проверяет строку за один проход в C
+    if text.isascii():
+        return text
+    return text.translate(_TRANSLIT)
 
 
 def normalize(text: str) -> str:
-    """Нормализация строки: trim + lower + убрать двойные пробелы"""
+    """Нормализация строки"""
     if pd.isna(text):
         return ""
-    text = str(text).strip().lower()
-    while "  " in text:
-        text = text.replace("  ", " ")
-    return text
+    # Переносы строк, табы и неразрывные пробелы схлопываем в один пробел
+    return re.sub(r"\s+", " ", str(text)).strip().lower()
+
+
+def normalize_series(s: pd.Series) -> pd.Series:
+    """Нормализация колонки целиком — normalize() один раз на каждое уникальное значение"""
+    # Строковые методы pandas на pyarrow (RE2) не считают \xa0 пробелом, поэтому
+    # используем ту же normalize(), что и для запросов. NaN получает код -1 — последний элемент
+    codes, uniques = pd.factorize(s)
+    normalized = np.array([normalize(v) for v in uniques] + [""], dtype=object)
+    return pd.Series(normalized[codes], index=s.index, dtype=object)
+
+
+def normalize_for_search(text: str) -> str:
+    """Нормализация для поиска — с транслитерацией"""
+    text = normalize(text)
+    # Транслитерируем кириллицу
+    return transliterate_ru_to_en(text)
+
+
+# Все алиасы одним регулярным выражением (длинные первыми — "клауд тауэр" раньше "клауд")
+_ALIAS_KEYS_RE = re.compile("|".join(sorted((re.escape(k) for k in ALIASES), key=len, reverse=True)))
+
+
+def apply_aliases(query: str) -> list:
+    """
+    Применить словарь алиасов.
+    Возвращает список вариантов запроса для поиска.
+    """
+    query_norm = normalize(query)
+    variants = [query_norm]
+    
+    # Проверяем точное совпадение с алиасом
+    if query_norm in ALIASES:
+        variants.append(normalize(ALIASES[query_norm]))
+    
+    # Заменяем все алиасы, которые содержатся в запросе, за один проход
+    replaced = _ALIAS_KEYS_RE.sub(lambda m: ALIASES[m.group(0)], query_norm)
+    if replaced not in variants:
+        variants.append(replaced)
+    
+    return variants
+
+
+# Индекс синонимов: нормализованное название → вся группа
+_SYN_INDEX = {}
+for _group in SYNONYMS:
+    for _name in _group:
+        _SYN_INDEX.setdefault(normalize(_name), _group)
+
+
+def get_synonyms(object_name: str) -> list:
+    """
+    Получить все синонимы объекта (включая сам объект).
+    """
+    # Нет синонимов — только сам объект
+    return _SYN_INDEX.get(normalize(object_name), [object_name])
+
+
+def _match_districts(entries: list, district_query_norm: str) -> list:
+    """Объекты справочника, у которых район или город совпадает с запросом (с вхождением)"""
+    results = []
+    
+    for entry, district_norm, city_norm in entries:
+        # Ищем по району (fuzzy)
+        if district_query_norm in district_norm or district_norm in district_query_norm:
+            results.append(entry)
+        # Также ищем по городу (для Дубая — можно искать "Дубай")
+        elif district_query_norm in city_norm or city_norm == district_query_norm:
+            results.append(entry)
+    
+    return results
+
+
+# Бот ищет в нескольких потоках сразу: lru_cache при одновременных промахах
+# посчитал бы одно и то же в каждом потоке, поэтому загрузку делаем под замком.
+# Готовые данные только читаются — их можно отдавать всем потокам без копий
+_LOAD_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _load_districts_cached(path_str: str, mtime: float) -> DistrictsData:
+    """
+    Прочитать справочник районов и подготовить данные для поиска.
+    Кэшируется по (путь, время изменения) — JSON читаем только после обновления.
+    """
+    with open(path_str, 'r', encoding='utf-8') as f:
+        objects = json.load(f).get("objects", {})
+    
+    entries = []
+    districts_set = set()
+    for obj_name, info in objects.items():
+        entry = {
+            "object": obj_name,
+            "district": info.get("district"),
+            "city": info.get("city"),
+            "country": info.get("country")
+        }
+        entries.append((entry, normalize(info.get("district", "")), normalize(info.get("city", ""))))
+        if entry["district"] and entry["city"]:
+            districts_set.add(f"{entry['district']} ({entry['city']})")
+    
+    # Для точных названий районов и городов результат считаем заранее — тем же
+    # поиском с вхождением, что и для остальных запросов ("Сокольники" находит и "Сокол")
+    by_name = {}
+    for _, district_norm, city_norm in entries:
+        for name in (district_norm, city_norm):
+            if name and name not in by_name:
+                by_name[name] = _match_districts(entries, name)
+    
+    all_districts = sorted(districts_set)
+    return DistrictsData(objects, entries, by_name, all_districts, [normalize(d) for d in all_districts])
+
+
+@lru_cache(maxsize=4)
+def _load_cached(path_str: str, mtime: float) -> pd.DataFrame:
+    """
+    Прочитать файл данных и подготовить служебные колонки.
+    Кэшируется по (путь, время изменения) — перечитываем только обновлённый файл.
+    """
+    if path_str.endswith(".parquet"):
+        df = pd.read_parquet(path_str)
+    else:
+        df = pd.read_excel(path_str)
+    
+    # Проверка колонок
+    required = ["Брокер", "Дата", "Объект"]
+    for col in required:
+        if col not in df.columns:
+            raise ValueError(f"Отсутствует колонка: {col}")
+    
+    df["_date"] = pd.to_datetime(df["Дата"], format="%d.%m.%Y", errors="coerce", cache=True)
+    
+    # Сортируем по дате: показы за любой период — это хвост таблицы.
+    # Индекс не сбрасываем — он хранит исходный порядок строк файла
+    df = df[df["_date"].notna()].sort_values("_date", kind="stable")
+    
+    df["_object_norm"] = normalize_series(df["Объект"])
+    
+    # Имя брокера без пробелов по краям, пустые — NaN
+    brokers = df["Брокер"].fillna("").astype(str).str.strip()
+    df["_broker_clean"] = brokers.where(brokers != "").astype("category")
+    
+    # Названия повторяются — категории сравниваются по целочисленным кодам
+    df["Объект"] = df["Объект"].astype("category")
+    df["Брокер"] = df["Брокер"].astype("category")
+    df["_object_norm"] = df["_object_norm"].astype("category")
+    return df
+
+
+@lru_cache(maxsize=4)
+def _load_recent(path_str: str, mtime: float, since: pd.Timestamp) -> ShowingsData:
+    """
+    Показы начиная с даты since, список объектов и индексы для find_best_match.
+    Кэшируется по (путь, время изменения, дата) — пересобирается при обновлении
+    файла и раз в сутки, а не на каждый запрос.
+    """
+    df = _load_cached(path_str, mtime)
+    
+    # Даты по возрастанию — начало периода находим бинарным поиском вместо булевой маски
+    start = np.searchsorted(df["_date"].to_numpy(), since.to_datetime64(), side="left")
+    # Возвращаем строки периода в порядке файла: от него зависят выбор объекта
+    # при равных совпадениях и порядок ЖК в ответе
+    df = df.iloc[start:].sort_index()
+    
+    # Уникальные объекты (с обрезкой пробелов, чтобы не дублировать один и тот же объект)
+    objects = df["Объект"].dropna().astype(str).str.strip()
+    objects = objects[objects != ""].unique().tolist()
+    objects_norm = [normalize(o) for o in objects]
+    objects_translit = [transliterate_ru_to_en(n) for n in objects_norm]
+    
+    # Индексы: точное название (как есть / транслит) → объект, слово (транслит) → номера объектов
+    norm_to_obj = {}
+    translit_to_obj = {}
+    token_index = defaultdict(set)
+    for i, obj in enumerate(objects):
+        norm_to_obj.setdefault(objects_norm[i], obj)
+        translit_to_obj.setdefault(objects_translit[i], obj)
+        for token in objects_translit[i].split():
+            token_index[token].add(i)
+    
+    return ShowingsData(df, objects, objects_translit, norm_to_obj, translit_to_obj, dict(token_index))
+
+
+def find_best_match(query: str, data: ShowingsData) -> tuple:
+    """
+    Найти ближайшее совпадение объекта.
+    Использует заранее подготовленные списки и индексы из data (см. _load_recent).
+    Возвращает (найденный_объект, score, exact_match) или (None, 0, False)
+    """
+    objects = data.objects
+    objects_translit = data.objects_translit
+    
+    if not objects:
+        return None, 0, False
+    
+    # Получаем варианты запроса через алиасы (+ их транслит — он же ключ всех индексов)
+    query_variants = apply_aliases(query)
+    query_translits = [normalize_for_search(v) for v in query_variants]
+    
+    # Для каждого варианта запроса пробуем найти совпадение.
+    # Транслитерация посимвольная: совпадение/вхождение нормализованных строк
+    # означает совпадение/вхождение их транслита, поэтому ниже сравниваем только транслит.
+    for query_variant, query_translit in zip(query_variants, query_translits):
+        # 1. Точное совпадение — поиск по словарю (сначала как написано, потом транслит)
+        obj = data.norm_to_obj.get(query_variant) or data.translit_to_obj.get(query_translit)
+        if obj:
+            return obj, 100, True
+        
+        # Кандидаты по словам запроса — сначала проверяем их, потом остальные объекты
+        token_sets = [data.token_index[t] for t in query_translit.split() if t in data.token_index]
+        
+        # 2. Вхождение (contains) — запрос содержится в объекте
+        candidates = sorted(set.intersection(*token_sets)) if token_sets else []
+        for i in chain(candidates, range(len(objects))):
+            if query_translit in objects_translit[i]:
+                return objects[i], 95, True
+        
+        # 3. Обратное вхождение — объект содержится в запросе
+        candidates = sorted(set.union(*token_sets)) if token_sets else []
+        for i in chain(candidates, range(len(objects))):
+            if objects_translit[i] in query_translit:
+                return objects[i], 90, True
+    
+    # 4. Fuzzy search с транслитерацией (порог 75) — только очень похожие
+    # Одна матрица score (варианты запроса × объекты) вместо цикла по вариантам
+    scores = process.cdist(
+        query_translits,
+        objects_translit,
+        scorer=fuzz.WRatio,
+        score_cutoff=75,  # высокий порог — только реально похожие
+        dtype=np.float64
+    )
+    variant_idx, idx = np.unravel_index(scores.argmax(), scores.shape)
+    score = float(scores[variant_idx, idx])
+    
+    if score:
+        return objects[idx], score, False
+    
+    return None, 0, False
 
 
-def parse_date(date_str: str) -> datetime:
-    """Парсинг даты в формате DD.MM.YYYY"""
-    return datetime.strptime(date_str, "%d.%m.%Y")
+class Matcher:
+    """
+    Поиск брокеров по выгрузке показов — общее ядро для бота и CLI.
+    Данные читаются через кэш (_load_cached / _load_recent), поэтому в долгоживущем
+    процессе (бот) файл разбирается один раз, а запросы работают с готовыми индексами.
+    """
+    
+    def __init__(self, data_file, districts_file=None, days: int = 14):
+        """
+        Args:
+            data_file: путь к xlsx файлу с выгрузкой
+            districts_file: путь к справочнику районов (для поиска по району)
+            days: период в днях для by_object / by_district
+        """
+        self.data_file = Path(data_file)
+        self.districts_file = Path(districts_file) if districts_file else None
+        self.days = days
+    
+    def data_source(self) -> Path:
+        """
+        Файл, из которого читаем показы: Parquet-копия (см. convert.py),
+        если она есть и не старше xlsx, иначе сам xlsx.
+        """
+        parquet_file = self.data_file.with_suffix(".parquet")
+        if parquet_file.exists() and (
+            not self.data_file.exists() or parquet_file.stat().st_mtime >= self.data_file.stat().st_mtime
+        ):
+            return parquet_file
+        return self.data_file
+    
+    def load_data(self, days: int = None):
+        """Загрузить данные из файла (только показы за последние days дней, по умолчанию self.days)"""
+        source = self.data_source()
+        if not source.exists():
+            return None, "Файл данных не найден"
+        
+        days = self.days if days is None else days
+        # Даты в файле без времени: ">= now - days" — то же, что ">= следующей полуночи".
+        # Округление вверх сохраняет прежнее окно и даёт один ключ кэша на сутки
+        since = pd.Timestamp(datetime.now() - timedelta(days=days)).ceil("D")
+        try:
+            with _LOAD_LOCK:
+                data = _load_recent(str(source), source.stat().st_mtime, since)
+        except ValueError as e:
+            return None, str(e)
+        
+        return data, None
+    
+    def districts(self) -> DistrictsData:
+        """Справочник районов из кэша (пустой, если файла нет)"""
+        if not self.districts_file or not self.districts_file.exists():
+            return DistrictsData({}, [], {}, [], [])
+        with _LOAD_LOCK:
+            return _load_districts_cached(str(self.districts_file), self.districts_file.stat().st_mtime)
+    
+    def load_districts(self):
+        """Загрузить справочник районов"""
+        return self.districts().objects
+    
+    def get_objects_by_district(self, district_query: str) -> list:
+        """
+        Найти все ЖК в указанном районе.
+        Возвращает список объектов.
+        """
+        districts = self.districts()
+        district_query_norm = normalize(district_query)
+        
+        # Точное название района или города — готовый результат из словаря
+        if district_query_norm in districts.by_name:
+            return list(districts.by_name[district_query_norm])
+        
+        # Иначе — поиск с вхождением по всему справочнику
+        return _match_districts(districts.entries, district_query_norm)
+    
+    def get_all_districts(self) -> list:
+        """Получить список всех уникальных районов"""
+        return list(self.districts().all_districts)
+    
+    def by_object(self, query: str) -> dict:
+        """
+        Поиск брокеров по объекту с fuzzy matching.
+        """
+        data, error = self.load_data()
+        if error:
+            return {"error": error}
+        
+        df = data.df
+        if df.empty:
+            return {"error": "Нет данных за указанный период"}
+        
+        # Поиск ближайшего объекта
+        best_match, score, exact = find_best_match(query, data)
+        
+        if not best_match:
+            return {
+                "found": False,
+                "query": query,
+                "days": self.days
+            }
+        
+        # Неточное совпадение — бот покажет только подсказку, брокеры не нужны
+        if not exact:
+            return {
+                "found": True,
+                "query": query,
+                "object": best_match,
+                "days": self.days,
+                "score": score,
+                "exact": False
+            }
+        
+        # Получаем все синонимы найденного объекта
+        synonyms = get_synonyms(best_match)
+        
+        # Фильтруем по всем синонимам (в нормализованном виде — без учёта регистра и пробелов)
+        synonyms_norm = [normalize(name) for name in synonyms]
+        df_filtered = df[df["_object_norm"].isin(synonyms_norm)]
+        
+        # Уникальные брокеры
+        brokers = sorted(df_filtered["_broker_clean"].dropna().unique())
+        
+        # Какие объекты реально нашлись в данных
+        found_objects = df_filtered["Объект"].unique().tolist()
+        
+        return {
+            "found": True,
+            "query": query,
+            "object": best_match,
+            "objects": found_objects,  # все найденные варианты
+            "days": self.days,
+            "brokers": brokers,
+            "score": score,
+            "exact": exact  # точное совпадение или fuzzy
+        }
+    
+    def by_district(self, district_query: str) -> dict:
+        """
+        Поиск брокеров по району.
+        Возвращает результаты сгруппированные по ЖК.
+        """
+        data, error = self.load_data()
+        if error:
+            return {"error": error}
+        
+        df = data.df
+        if df.empty:
+            return {"error": "Нет данных за указанный период"}
+        
+        # Получаем все ЖК в этом районе из справочника
+        district_objects = self.get_objects_by_district(district_query)
+        
+        if not district_objects:
+            # Пробуем fuzzy поиск по названию района
+            districts = self.districts()
+            all_districts = districts.all_districts
+            district_query_norm = normalize(district_query)
+        
+            # Fuzzy поиск
+            result = process.extractOne(
+                district_query_norm,
+                districts.all_districts_norm,
+                scorer=fuzz.WRatio,
+                score_cutoff=70
+            )
+        
+            if result:
+                match_norm, score, idx = result
+                suggested = all_districts[idx]
+                return {
+                    "found": False,
+                    "query": district_query,
+                    "suggestion": suggested,
+                    "days": self.days
+                }
+        
+            return {
+                "found": False,
+                "query": district_query,
+                "days": self.days
+            }
+        
+        # Собираем имена ЖК из справочника
+        object_names = [obj["object"] for obj in district_objects]
+        
+        # Фильтруем данные по этим объектам
+        # Нормализуем для сравнения
+        objects_norm = dict(zip(pd.Series(object_names).pipe(normalize_series).tolist(), object_names))
+        
+        # Находим объекты, которые есть в данных
+        df_filtered = df[df["_object_norm"].isin(objects_norm.keys())]
+        
+        if df_filtered.empty:
+            # Район есть в справочнике, но показов нет
+            district_info = district_objects[0]  # Берём информацию о районе
+            return {
+                "found": True,
+                "no_showings": True,
+                "query": district_query,
+                "district": district_info.get("district"),
+                "city": district_info.get("city"),
+                "objects_in_district": object_names,
+                "days": self.days
+            }
+        
+        # Группируем по ЖК и собираем брокеров (порядок ЖК — по первому показу)
+        brokers = df_filtered["_broker_clean"].dropna()
+        # observed=True — только ЖК из выборки, а не все категории файла (в pandas 2.x по умолчанию False)
+        grouped = brokers.groupby(df_filtered["_object_norm"], sort=False, observed=True).unique()
+        results_by_object = {objects_norm[obj_norm]: sorted(names) for obj_norm, names in grouped.items()}
+        
+        # Формируем результат
+        district_info = district_objects[0]
+        
+        return {
+            "found": True,
+            "query": district_query,
+            "district": district_info.get("district"),
+            "city": district_info.get("city"),
+            "days": self.days,
+            "by_object": results_by_object,
+            "total_brokers": len(set().union(*results_by_object.values())) if results_by_object else 0
+        }
+    
+    def find_brokers(
+        self,
+        object_query: str,
+        days: int = None,
+        match_mode: str = "exact",
+        exclude_status: str = None
+    ) -> dict:
+        """
+        Найти брокеров по объекту (без fuzzy — режим CLI).
+        
+        Args:
+            object_query: запрос (название объекта)
+            days: период в днях (по умолчанию self.days)
+            match_mode: "exact" или "contains"
+            exclude_status: статус для исключения (например "Отменен")
+        
+        Returns:
+            dict с результатами
+        """
+        days = self.days if days is None else days
+        data, error = self.load_data(days)
+        if error:
+            raise ValueError(error)
+        df = data.df
+        
+        # Нормализация запроса
+        query_norm = normalize(object_query)
+        
+        # Фильтр по объекту
+        if match_mode == "exact":
+            df = df[df["_object_norm"] == query_norm]
+        else:  # contains — поиск подстроки без регулярных выражений
+            df = df[df["_object_norm"].str.contains(query_norm, regex=False, na=False)]
+        
+        # Фильтр по статусу
+        if exclude_status and "Статус" in df.columns:
+            df = df[df["Статус"] != exclude_status]
+        
+        # Уникальные брокеры
+        brokers = sorted(df["_broker_clean"].dropna().unique())
+        
+        return {
+            "object": object_query,
+            "days": days,
+            "match": match_mode,
+            "brokers": brokers
+        }
 
 
 def find_brokers(
@@ -40,44 +655,4 @@ def find_brokers(
     Returns:
         dict с результатами
     """
-    # Загрузка
-    df = pd.read_excel(file_path)
-    
-    # Проверка колонок
-    required = ["Брокер", "Дата", "Объект"]
-    for col in required:
-        if col not in df.columns:
-            raise ValueError(f"Отсутствует колонка: {col}")
-    
-    # Нормализация запроса
-    query_norm = normalize(object_query)
-    
-    # Нормализация объектов
-    df["_object_norm"] = df["Объект"].apply(normalize)
-    
-    # Фильтр по дате
-    cutoff = datetime.now() - timedelta(days=days)
-    df["_date"] = df["Дата"].apply(parse_date)
-    df = df[df["_date"] >= cutoff]
-    
-    # Фильтр по объекту
-    if match_mode == "exact":
-        df = df[df["_object_norm"] == query_norm]
-    else:  # contains
-        df = df[df["_object_norm"].str.contains(query_norm, na=False)]
-    
-    # Фильтр по статусу
-    if exclude_status and "Статус" in df.columns:
-        df = df[df["Статус"] != exclude_status]
-    
-    # Уникальные брокеры
-    brokers = df["Брокер"].dropna().str.strip()
-    brokers = brokers[brokers != ""]
-    brokers = sorted(brokers.unique())
-    
-    return {
-        "object": object_query,
-        "days": days,
-        "match": match_mode,
-        "brokers": brokers
-    }
+    return Matcher(file_path).find_brokers(object_query, days, match_mode, exclude_status)